@@ -334,6 +334,7 @@ async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
         return
 
     hass_data = hass.data[DOMAIN]
+    dev_reg = dr.async_get(hass)
     ent_reg = er.async_get(hass)
     entities_to_remove: dict[str, bool] = {}
     entities_to_add: dict[str, bool] = {}
@@ -386,7 +387,6 @@ async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
         async_dispatcher_send(hass, f"{DOMAIN}_{entry_id}_remove_lock", lock_entity_id)
         lock: BaseLock = hass.data[DOMAIN][CONF_LOCKS][lock_entity_id]
         if lock.device_entry:
-            dev_reg = dr.async_get(hass)
             dev_reg.async_update_device(
                 lock.device_entry.id, remove_config_entry_id=entry_id
             )
@@ -394,8 +394,8 @@ async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
             hass, config_entry, lock_entity_id=lock_entity_id, remove_permanently=True
         )
 
-    # Notify any existing entities that additional locks have been added then create
-    # slot PIN sensors for the new locks
+    # Create slot PIN sensors for the new locks then notify any existing entities
+    # that additional locks have been added
     if locks_to_add:
         _LOGGER.debug(
             "%s (%s): Adding following locks: %s",
@@ -403,7 +403,7 @@ async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
             entry_title,
             locks_to_add,
         )
-        async_dispatcher_send(hass, f"{DOMAIN}_{entry_id}_add_locks", locks_to_add)
+        added_locks: list[BaseLock] = []
         for lock_entity_id in locks_to_add:
             if lock_entity_id in hass_data[CONF_LOCKS]:
                 _LOGGER.debug(
@@ -420,7 +420,7 @@ async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
                     entry_id
                 ][CONF_LOCKS][lock_entity_id] = async_create_lock_instance(
                     hass,
-                    dr.async_get(hass),
+                    dev_reg,
                     ent_reg,
                     config_entry,
                     lock_entity_id,
@@ -484,6 +484,9 @@ async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
                 async_dispatcher_send(
                     hass, f"{DOMAIN}_{entry_id}_add_lock_slot", lock, slot_num, ent_reg
                 )
+            added_locks.append(lock)
+
+        async_dispatcher_send(hass, f"{DOMAIN}_{entry_id}_add_locks", added_locks)
 
     # Remove slot sensors that are no longer in the config
     for slot_num in slots_to_remove.keys():
@@ -20,9 +20,9 @@ from homeassistant.const import (
     STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
-    Platform,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Event,
     EventStateChangedData,
     HomeAssistant,
@@ -54,6 +54,8 @@ from .providers import BaseLock
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=30)
 
+INVALID_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -111,6 +113,21 @@ class LockCodeManagerActiveEntity(BaseLockCodeManagerEntity, BinarySensorEntity)
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ent_reg: er.EntityRegistry,
+        config_entry: ConfigEntry,
+        slot_num: int,
+        key: str,
+    ) -> None:
+        """Initialize entity."""
+        BaseLockCodeManagerEntity.__init__(
+            self, hass, ent_reg, config_entry, slot_num, key
+        )
+        self._tracked_calendar_entity_id: str | None = None
+        self._unsub_calendar: CALLBACK_TYPE | None = None
+
     @callback
     def _update_state(self, _: datetime | None = None) -> None:
         """Update binary sensor state by getting dependent states."""
@@ -129,7 +146,12 @@ class LockCodeManagerActiveEntity(BaseLockCodeManagerEntity, BinarySensorEntity)
                 states[key] = hass_state.state == STATE_ON
                 continue
             if key == CONF_NUMBER_OF_USES:
-                states[key] = bool(int(float(state)))
+                # Number of uses is almost always stored as an integer, so only
+                # fall back to parsing a float when we have to
+                try:
+                    states[key] = bool(int(state))
+                except ValueError:
+                    states[key] = bool(int(float(state)))
                 continue
             states[key] = state
 
@@ -151,28 +173,45 @@ class LockCodeManagerActiveEntity(BaseLockCodeManagerEntity, BinarySensorEntity)
         """Update listener."""
         if config_entry.options:
             return
+        # The slot's calendar may have changed, so make sure we are tracking the
+        # right one
+        if self._calendar_entity_id != self._tracked_calendar_entity_id:
+            self._track_calendar()
         self._update_state()
 
+    @callback
+    def _track_calendar(self) -> None:
+        """Track state changes of the slot's calendar."""
+        self._stop_tracking_calendar()
+        if calendar_entity_id := self._calendar_entity_id:
+            self._unsub_calendar = async_track_state_change_filtered(
+                self.hass,
+                TrackStates(False, {calendar_entity_id}, set()),
+                self._handle_calendar_state_changes,
+            ).async_remove
+        self._tracked_calendar_entity_id = calendar_entity_id
+
+    @callback
+    def _stop_tracking_calendar(self) -> None:
+        """Stop tracking state changes of the slot's calendar."""
+        if self._unsub_calendar is not None:
+            self._unsub_calendar()
+            self._unsub_calendar = None
+
     @callback
     def _handle_calendar_state_changes(
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Handle calendar state changes."""
-        if event.data["entity_id"] == self._calendar_entity_id:
-            self._update_state()
+        self._update_state()
 
     async def async_added_to_hass(self) -> None:
         """Handle entity added to hass."""
         await BinarySensorEntity.async_added_to_hass(self)
         await BaseLockCodeManagerEntity.async_added_to_hass(self)
 
-        self.async_on_remove(
-            async_track_state_change_filtered(
-                self.hass,
-                TrackStates(False, set(), {Platform.CALENDAR}),
-                self._handle_calendar_state_changes,
-            ).async_remove
-        )
+        self._track_calendar()
+        self.async_on_remove(self._stop_tracking_calendar)
 
         self.async_on_remove(
             self.config_entry.add_update_listener(self._config_entry_update_listener)
@@ -232,7 +271,7 @@ class LockCodeManagerCodeSlotInSyncEntity(
             self._lock.locked()
             or self.is_on
             or not (state := self.hass.states.get(self.lock.lock.entity_id))
-            or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+            or state.state in INVALID_STATES
             or not self.coordinator.last_update_success
         ):
             return
@@ -272,15 +311,13 @@ class LockCodeManagerCodeSlotInSyncEntity(
                     (TEXT_DOMAIN, self._pin_text_unique_id),
                     (SENSOR_DOMAIN, self._lock_slot_sensor_unique_id),
                 )
-                or (
-                    to_state is not None
-                    and to_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
-                )
+                or (to_state is not None and to_state.state in INVALID_STATES)
             )
         ):
             return
 
         async with self._lock:
+            states: dict[str, str] = {}
             for key, domain, unique_id in (
                 (CONF_PIN, TEXT_DOMAIN, self._pin_text_unique_id),
                 (CONF_NAME, TEXT_DOMAIN, self._name_text_unique_id),
@@ -296,17 +333,16 @@ class LockCodeManagerCodeSlotInSyncEntity(
                         return
                     self._entity_id_map[key] = ent_id
 
-                if self._get_entity_state(key) is None:
+                if (state := self._get_entity_state(key)) is None:
                     return
+                states[key] = state
 
-            if self._get_entity_state(ATTR_ACTIVE) == STATE_ON:
-                if (
-                    pin_state := self._get_entity_state(CONF_PIN)
-                ) is not None and pin_state != self._get_entity_state(ATTR_CODE):
+            if (active_state := states[ATTR_ACTIVE]) == STATE_ON:
+                if (pin_state := states[CONF_PIN]) != states[ATTR_CODE]:
                     self._attr_is_on = False
                     self.async_write_ha_state()
                     await self.lock.async_internal_set_usercode(
-                        int(self.slot_num), pin_state, self._get_entity_state(CONF_NAME)
+                        int(self.slot_num), pin_state, states[CONF_NAME]
                     )
                     _LOGGER.info(
                         "%s (%s): Set usercode for %s slot %s",
@@ -319,8 +355,8 @@ class LockCodeManagerCodeSlotInSyncEntity(
                     return
                 else:
                     self._attr_is_on = True
-            elif self._get_entity_state(ATTR_ACTIVE) == STATE_OFF:
-                if self._get_entity_state(ATTR_CODE) != "":
+            elif active_state == STATE_OFF:
+                if states[ATTR_CODE] != "":
                     self._attr_is_on = False
                     self.async_write_ha_state()
                     await self.lock.async_internal_clear_usercode(int(self.slot_num))
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 from typing import Any, final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID, STATE_UNAVAILABLE, STATE_UNLOCKED
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Event,
     EventStateChangedData,
     HomeAssistant,
@@ -61,6 +61,7 @@ class BaseLockCodeManagerEntity(Entity):
         self.ent_reg = ent_reg
 
         self._uid_cache: dict[str, str] = {}
+        self._unsub_availability: CALLBACK_TYPE | None = None
 
         self._attr_translation_key = key
         self._attr_translation_placeholders = {"slot_num": slot_num}
@@ -93,9 +94,9 @@ class BaseLockCodeManagerEntity(Entity):
     @final
     def _get_uid(self, key: str) -> str:
         """Get and cache unique id for a given key."""
-        if key not in self._uid_cache:
-            self._uid_cache[key] = f"{self.base_unique_id}|{self.slot_num}|{key}"
-        return self._uid_cache[key]
+        if (uid := self._uid_cache.get(key)) is None:
+            uid = self._uid_cache[key] = f"{self.base_unique_id}|{self.slot_num}|{key}"
+        return uid
 
     @callback
     @final
@@ -108,9 +109,19 @@ class BaseLockCodeManagerEntity(Entity):
             self.key,
             value,
         )
-        data = copy.deepcopy(dict(self.config_entry.data))
-        data[CONF_SLOTS][self.slot_num][self.key] = value
-        self.hass.config_entries.async_update_entry(self.config_entry, data=data)
+        # Only copy the containers on the path to the changed value
+        data = self.config_entry.data
+        slots = data[CONF_SLOTS]
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={
+                **data,
+                CONF_SLOTS: {
+                    **slots,
+                    self.slot_num: {**slots[self.slot_num], self.key: value},
+                },
+            },
+        )
         self.async_write_ha_state()
 
     async def _internal_async_remove(self) -> None:
@@ -148,6 +159,7 @@ class BaseLockCodeManagerEntity(Entity):
         self.locks = [
             lock for lock in self.locks if lock.lock.entity_id != lock_entity_id
         ]
+        self._update_availability_tracker()
 
     @callback
     def _handle_add_locks(self, locks: list[BaseLock]) -> None:
@@ -156,7 +168,11 @@ class BaseLockCodeManagerEntity(Entity):
 
         Can be overwritten by platforms.
         """
-        self.locks.extend(locks)
+        lock_entity_ids = {lock.lock.entity_id for lock in self.locks}
+        self.locks.extend(
+            lock for lock in locks if lock.lock.entity_id not in lock_entity_ids
+        )
+        self._update_availability_tracker()
 
     @callback
     def dispatcher_connect(self) -> None:
@@ -206,6 +222,32 @@ class BaseLockCodeManagerEntity(Entity):
             and event_data[ATTR_TO] == STATE_UNLOCKED
         )
 
+    @callback
+    def _track_lock_availability(self) -> None:
+        """Track state changes of the entity's locks to determine availability."""
+        if self._unsub_availability is not None:
+            self._unsub_availability()
+        self._unsub_availability = async_track_state_change_filtered(
+            self.hass,
+            TrackStates(False, {lock.lock.entity_id for lock in self.locks}, set()),
+            self._handle_available_state_update,
+        ).async_remove
+
+    @callback
+    def _stop_tracking_lock_availability(self) -> None:
+        """Stop tracking state changes of the entity's locks."""
+        if self._unsub_availability is not None:
+            self._unsub_availability()
+            self._unsub_availability = None
+
+    @callback
+    def _update_availability_tracker(self) -> None:
+        """Update availability tracker when the set of locks changes."""
+        if self._unsub_availability is None:
+            return
+        self._track_lock_availability()
+        self._handle_available_state_update()
+
     @callback
     def _is_available(self) -> bool:
         """Return whether entity should be available."""
@@ -220,19 +262,12 @@ class BaseLockCodeManagerEntity(Entity):
         self, event: Event[EventStateChangedData] | None = None
     ) -> None:
         """Update binary sensor state by getting dependent states."""
-        entity_id: str | None = None
         from_state: State | None = None
         to_state: State | None = None
         if event:
-            entity_id = event.data["entity_id"]
             from_state = event.data["old_state"]
             to_state = event.data["new_state"]
 
-        if entity_id is not None and entity_id not in (
-            lock.lock.entity_id for lock in self.locks
-        ):
-            return
-
         if (from_state and STATE_UNAVAILABLE != from_state.state) and (
             to_state and STATE_UNAVAILABLE != to_state.state
         ):
@@ -247,13 +282,8 @@ class BaseLockCodeManagerEntity(Entity):
         await Entity.async_added_to_hass(self)
 
         self.dispatcher_connect()
-        self.async_on_remove(
-            async_track_state_change_filtered(
-                self.hass,
-                TrackStates(True, set(), set()),
-                self._handle_available_state_update,
-            ).async_remove
-        )
+        self._track_lock_availability()
+        self.async_on_remove(self._stop_tracking_lock_availability)
         self._handle_available_state_update()
 
         _LOGGER.debug(
@@ -64,29 +64,24 @@ def get_locks_from_targets(
             if ent.domain == LOCK_DOMAIN
         )
     for entity_id in entity_ids:
-        if not entity_id.startswith(LOCK_DOMAIN):
+        if not entity_id.startswith(f"{LOCK_DOMAIN}."):
             _LOGGER.warning(
                 "Entity ID %s is not a lock entity, skipping",
                 entity_id,
             )
             continue
         lock_entity_ids.add(entity_id)
+    all_locks: dict[str, BaseLock] = hass.data[DOMAIN][CONF_LOCKS]
     for lock_entity_id in lock_entity_ids:
-        try:
-            locks.add(
-                next(
-                    lock
-                    for lock in hass.data[DOMAIN][CONF_LOCKS].values()
-                    if lock_entity_id == lock.lock.entity_id
-                )
-            )
-        except StopIteration:
+        if (lock := all_locks.get(lock_entity_id)) is None:
             _LOGGER.warning(
                 (
                     "Lock with entity ID %s does not have a Lock Code Manager entry, "
                     "skipping"
                 ),
-                entity_id,
+                lock_entity_id,
             )
+            continue
+        locks.add(lock)
 
     return locks
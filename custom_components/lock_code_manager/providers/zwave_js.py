@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import logging
-from typing import Any, Callable, Iterable
+from typing import Any, Callable
 
 from zwave_js_server.const.command_class.lock import ATTR_CODE_SLOT, ATTR_USERCODE
 from zwave_js_server.const.command_class.notification import (
@@ -66,6 +66,12 @@ ACCESS_CONTROL_NOTIFICATION_TO_LOCKED = {
         AccessControlNotificationEvent.UNLOCK_OPERATION_WITH_USER_CODE,
     ),
 }
+# Reverse lookup of the above so an event can be resolved with a single dict lookup
+ACCESS_CONTROL_NOTIFICATION_EVENT_TO_LOCKED: dict[int, bool] = {
+    event: to_locked
+    for to_locked, events in ACCESS_CONTROL_NOTIFICATION_TO_LOCKED.items()
+    for event in events
+}
 
 
 @dataclass(repr=False, eq=False)
@@ -86,18 +92,22 @@ class ZWaveJSLock(BaseLock):
     def _zwave_js_event_filter(self, event_data: dict[str, Any]) -> bool:
         """Filter out events."""
         # Try to find the lock that we are getting an event for, skipping
-        # ones that don't match
-        assert self.node.client.driver
+        # ones that don't match. The device ID check is cheap so do it first,
+        # and only look up the node (which goes through the registries) once
+        if event_data[ATTR_DEVICE_ID] != self.lock.device_id:
+            return False
+        node = self.node
+        assert node.client.driver
         return (
-            event_data[ATTR_HOME_ID] == self.node.client.driver.controller.home_id
-            and event_data[ATTR_NODE_ID] == self.node.node_id
-            and event_data[ATTR_DEVICE_ID] == self.lock.device_id
+            event_data[ATTR_HOME_ID] == node.client.driver.controller.home_id
+            and event_data[ATTR_NODE_ID] == node.node_id
         )
 
     @callback
     def _handle_zwave_js_event(self, evt: Event) -> None:
         """Handle Z-Wave JS event."""
-        if evt.data[ATTR_TYPE] != NotificationType.ACCESS_CONTROL:
+        data = evt.data
+        if data[ATTR_TYPE] != NotificationType.ACCESS_CONTROL:
             _LOGGER.debug(
                 "Lock %s received non Access Control event: %s",
                 self.lock.entity_id,
@@ -105,19 +115,11 @@ class ZWaveJSLock(BaseLock):
             )
             return
 
-        params = evt.data.get(ATTR_PARAMETERS) or {}
-        code_slot = params.get("userId", 0)
+        params = data.get(ATTR_PARAMETERS) or {}
         self.async_fire_code_slot_event(
-            code_slot=code_slot,
-            to_locked=next(
-                (
-                    to_locked
-                    for to_locked, codes in ACCESS_CONTROL_NOTIFICATION_TO_LOCKED.items()
-                    if evt.data[ATTR_EVENT] in codes
-                ),
-                None,
-            ),
-            action_text=evt.data.get(ATTR_EVENT_LABEL),
+            code_slot=params.get("userId", 0),
+            to_locked=ACCESS_CONTROL_NOTIFICATION_EVENT_TO_LOCKED.get(data[ATTR_EVENT]),
+            action_text=data.get(ATTR_EVENT_LABEL),
             source_data=evt,
         )
 
@@ -199,12 +201,12 @@ class ZWaveJSLock(BaseLock):
 
     async def async_get_usercodes(self) -> dict[int, int | str]:
         """Get dictionary of code slots and usercodes."""
-        code_slots: Iterable[int] = (
+        code_slots: set[int] = {
             int(code_slot)
             for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if self.lock.entity_id in get_entry_data(entry, CONF_LOCKS, [])
             for code_slot in get_entry_data(entry, CONF_SLOTS, {})
-            if self.lock.entity_id not in get_entry_data(entry, CONF_LOCKS, [])
-        )
+        }
         data: dict[int, int | str] = {}
         code_slot = 1
 
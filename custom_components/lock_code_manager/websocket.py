@@ -38,11 +38,13 @@ def async_get_entry(
     ) -> None:
         """Provide user specific data and store to function."""
         if config_entry_title := msg.get("config_entry_title"):
+            config_entry_slug = slugify(config_entry_title)
             config_entry = next(
                 (
                     entry
                     for entry in hass.config_entries.async_entries(DOMAIN)
-                    if slugify(entry.title) == slugify(config_entry_title)
+                    if entry.title == config_entry_title
+                    or slugify(entry.title) == config_entry_slug
                 ),
                 None,
             )
@@ -151,3 +151,26 @@ async def test_binary_sensor_entity(
     state = hass.states.get(ACTIVE_ENTITY)
     assert state
     assert state.state == STATE_OFF
+
+    # The active entity now follows the new calendar
+    cal_event = calendar_2.create_event(dtstart=start, dtend=end, summary="test")
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ACTIVE_ENTITY)
+    assert state
+    assert state.state == STATE_ON
+
+    calendar_2.delete_event(cal_event.uid)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ACTIVE_ENTITY)
+    assert state
+    assert state.state == STATE_OFF
+
+    # Events on the old calendar no longer affect the active entity
+    calendar_1.create_event(dtstart=start, dtend=end, summary="test")
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ACTIVE_ENTITY)
+    assert state
+    assert state.state == STATE_OFF
@@ -16,6 +16,8 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_PIN,
     CONF_URL,
+    STATE_LOCKED,
+    STATE_UNAVAILABLE,
     Platform,
 )
 from homeassistant.core import HomeAssistant
@@ -35,6 +37,7 @@ from custom_components.lock_code_manager.const import (
 
 from .common import (
     BASE_CONFIG,
+    ENABLED_ENTITY,
     LOCK_1_ENTITY_ID,
     LOCK_2_ENTITY_ID,
     LOCK_DATA,
@@ -194,6 +197,63 @@ async def test_entry_setup_and_unload(
     assert len(hass.states.async_entity_ids(Platform.TEXT)) == 4
 
 
+async def test_add_lock_tracks_availability(
+    hass: HomeAssistant, mock_lock_config_entry, lock_code_manager_config_entry
+):
+    """Test that entity availability follows locks added through options."""
+    new_config = copy.deepcopy(BASE_CONFIG)
+    new_config[CONF_LOCKS] = [LOCK_1_ENTITY_ID]
+    assert hass.config_entries.async_update_entry(
+        lock_code_manager_config_entry, options=new_config
+    )
+    await hass.async_block_till_done()
+
+    # Add the second lock back
+    assert hass.config_entries.async_update_entry(
+        lock_code_manager_config_entry, options=copy.deepcopy(BASE_CONFIG)
+    )
+    await hass.async_block_till_done()
+
+    # Entity is still available as long as the newly added lock is available
+    hass.states.async_set(LOCK_1_ENTITY_ID, STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    state = hass.states.get(ENABLED_ENTITY)
+    assert state
+    assert state.state != STATE_UNAVAILABLE
+
+    hass.states.async_set(LOCK_2_ENTITY_ID, STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    state = hass.states.get(ENABLED_ENTITY)
+    assert state
+    assert state.state == STATE_UNAVAILABLE
+
+    hass.states.async_set(LOCK_2_ENTITY_ID, STATE_LOCKED)
+    await hass.async_block_till_done()
+    state = hass.states.get(ENABLED_ENTITY)
+    assert state
+    assert state.state != STATE_UNAVAILABLE
+
+
+async def test_hard_refresh_usercodes_skips_non_lock_entities(
+    hass: HomeAssistant,
+    mock_lock_config_entry,
+    lock_code_manager_config_entry,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test hard refresh usercodes skips entities that aren't locks."""
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_HARD_REFRESH_USERCODES,
+        {ATTR_ENTITY_ID: [LOCK_1_ENTITY_ID, "lock_group.test"]},
+        blocking=True,
+    )
+    assert "Entity ID lock_group.test is not a lock entity, skipping" in caplog.text
+    assert hass.data[LOCK_DATA][LOCK_1_ENTITY_ID]["service_calls"]["hard_refresh_codes"]
+    assert not hass.data[LOCK_DATA][LOCK_2_ENTITY_ID]["service_calls"][
+        "hard_refresh_codes"
+    ]
+
+
 async def test_reauth(hass: HomeAssistant, lock_code_manager_config_entry):
     """Test reauth."""
     assert (
@@ -12,6 +12,9 @@ from .common import LOCK_1_ENTITY_ID, LOCK_2_ENTITY_ID
 
 _LOGGER = logging.getLogger(__name__)
 
+GET_SLOT_CALENDAR_DATA = {"type": "lock_code_manager/get_slot_calendar_data"}
+GET_CONFIG_ENTRY_ENTITIES = {"type": "lock_code_manager/get_config_entry_entities"}
+
 
 async def test_get_slot_calendar_data(
     hass: HomeAssistant,
@@ -22,53 +25,35 @@ async def test_get_slot_calendar_data(
     """Test get_slot_calendar_data WS API."""
     ws_client = await hass_ws_client(hass)
 
-    # Try API call with entry ID
-    await ws_client.send_json(
-        {
-            "id": 1,
-            "type": "lock_code_manager/get_slot_calendar_data",
-            "config_entry_id": lock_code_manager_config_entry.entry_id,
-        }
-    )
-    msg = await ws_client.receive_json()
-    assert msg["success"]
-    assert msg["result"] == {
-        CONF_LOCKS: [LOCK_1_ENTITY_ID, LOCK_2_ENTITY_ID],
-        CONF_SLOTS: {"1": None, "2": "calendar.test_1"},
-    }
-
-    # Try API call with entry title
-    await ws_client.send_json(
-        {
-            "id": 2,
-            "type": "lock_code_manager/get_slot_calendar_data",
-            "config_entry_title": "mock-title",
-        }
+    # These requests don't depend on each other, so send them all before reading
+    # any of the responses
+    requests = (
+        # Try API call with entry ID
+        {"config_entry_id": lock_code_manager_config_entry.entry_id},
+        # Try API call with entry title
+        {"config_entry_title": "mock-title"},
+        # Try API call with invalid entry ID
+        {"config_entry_id": "fake_entry_id"},
+        # Try API call without entry title or ID
+        {},
     )
-    msg = await ws_client.receive_json()
-    assert msg["success"]
-    assert msg["result"] == {
-        CONF_LOCKS: [LOCK_1_ENTITY_ID, LOCK_2_ENTITY_ID],
-        CONF_SLOTS: {"1": None, "2": "calendar.test_1"},
-    }
-
-    # Try API call with invalid entry ID
-    await ws_client.send_json(
-        {
-            "id": 3,
-            "type": "lock_code_manager/get_slot_calendar_data",
-            "config_entry_id": "fake_entry_id",
+    for msg_id, request in enumerate(requests, start=1):
+        await ws_client.send_json({"id": msg_id, **GET_SLOT_CALENDAR_DATA, **request})
+    # Responses can arrive out of order so key them by ID
+    msgs = {}
+    for _ in requests:
+        msg = await ws_client.receive_json()
+        msgs[msg["id"]] = msg
+
+    for msg_id in (1, 2):
+        assert msgs[msg_id]["success"]
+        assert msgs[msg_id]["result"] == {
+            CONF_LOCKS: [LOCK_1_ENTITY_ID, LOCK_2_ENTITY_ID],
+            CONF_SLOTS: {"1": None, "2": "calendar.test_1"},
         }
-    )
-    msg = await ws_client.receive_json()
-    assert not msg["success"]
 
-    # Try API call without entry title or ID
-    await ws_client.send_json(
-        {"id": 4, "type": "lock_code_manager/get_slot_calendar_data"}
-    )
-    msg = await ws_client.receive_json()
-    assert not msg["success"]
+    for msg_id in (3, 4):
+        assert not msgs[msg_id]["success"]
 
     await hass.config_entries.async_unload(lock_code_manager_config_entry.entry_id)
 
@@ -76,7 +61,7 @@ async def test_get_slot_calendar_data(
     await ws_client.send_json(
         {
             "id": 5,
-            "type": "lock_code_manager/get_slot_calendar_data",
+            **GET_SLOT_CALENDAR_DATA,
             "config_entry_id": lock_code_manager_config_entry.entry_id,
         }
     )
@@ -97,7 +82,7 @@ async def test_get_config_entry_entities(
     await ws_client.send_json(
         {
             "id": 1,
-            "type": "lock_code_manager/get_config_entry_entities",
+            **GET_CONFIG_ENTRY_ENTITIES,
             "config_entry_id": lock_code_manager_config_entry.entry_id,
         }
     )
@@ -1,6 +1,14 @@
 """Test the Z-Wave JS lock platform."""
 
+from unittest.mock import PropertyMock, patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.lock_code_manager.const import CONF_LOCKS, CONF_SLOTS, DOMAIN
+from custom_components.lock_code_manager.providers.zwave_js import ZWaveJSLock
 
 SCHLAGE_BE469_LOCK_ENTITY = "lock.touchscreen_deadbolt"
 
@@ -8,3 +16,44 @@ SCHLAGE_BE469_LOCK_ENTITY = "lock.touchscreen_deadbolt"
 async def test_door_lock(hass: HomeAssistant) -> None:
     """Test a lock entity with door lock command class."""
     pass
+
+
+async def test_get_usercodes_only_fetches_managed_slots(hass: HomeAssistant) -> None:
+    """Test only unpopulated slots managed for this lock are fetched from the node."""
+    MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_LOCKS: [SCHLAGE_BE469_LOCK_ENTITY], CONF_SLOTS: {1: {}}},
+    ).add_to_hass(hass)
+    MockConfigEntry(
+        domain=DOMAIN, data={CONF_LOCKS: ["lock.other"], CONF_SLOTS: {2: {}}}
+    ).add_to_hass(hass)
+
+    lock = ZWaveJSLock(
+        hass,
+        dr.async_get(hass),
+        er.async_get(hass),
+        MockConfigEntry(),
+        er.RegistryEntry(SCHLAGE_BE469_LOCK_ENTITY, "blah", "blah"),
+    )
+
+    with (
+        patch.object(ZWaveJSLock, "node", new_callable=PropertyMock),
+        patch.object(ZWaveJSLock, "async_is_connection_up", return_value=True),
+        patch(
+            "custom_components.lock_code_manager.providers.zwave_js.get_usercodes",
+            return_value=[
+                {"code_slot": code_slot, "usercode": None, "in_use": None}
+                for code_slot in (1, 2, 3)
+            ],
+        ),
+        patch(
+            "custom_components.lock_code_manager.providers.zwave_js."
+            "get_usercode_from_node",
+            return_value={"usercode": "1234", "in_use": True},
+        ) as mock_get_usercode_from_node,
+    ):
+        assert await lock.async_get_usercodes() == {1: "1234", 2: "", 3: ""}
+
+    # Only slot 1 is managed for this lock, slot 2 belongs to another lock's entry
+    mock_get_usercode_from_node.assert_called_once()
+    assert mock_get_usercode_from_node.call_args.args[1] == 1